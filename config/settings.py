@@ -11,12 +11,21 @@ class Settings:
     API_MAX_RETRIES = 3
     API_REQUEST_DELAY = 2  # seconds
     API_RATE_LIMIT_COOLDOWN = 120  # seconds
+    API_RATE_LIMIT_PER_SECOND = 2  # sustained Yahoo requests per second
+    API_RATE_LIMIT_BURST = 4  # requests allowed back to back before pacing starts
     
     # File Paths
     BASE_DIR = Path(__file__).parent.parent
     DATA_DIR = BASE_DIR / "data"
     EXPORT_DIR = DATA_DIR / "exports"
     LOG_DIR = BASE_DIR / "logs"
+    CACHE_DIR = DATA_DIR / "cache"
+    
+    # Cache Settings (time to live per provider call)
+    CACHE_TTL_FINANCIALS = 24 * 60 * 60  # seconds
+    CACHE_TTL_COMPANY_INFO = 7 * 24 * 60 * 60  # seconds
+    CACHE_TTL_NEWS = 15 * 60  # seconds
+    CACHE_TTL_HISTORY = 24 * 60 * 60  # seconds
     
     # Logging Settings
     LOG_LEVEL = "ERROR"
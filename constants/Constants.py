@@ -77,6 +77,20 @@ FINANCIAL_STATEMENT_TYPES = {
     }
 }
 
+# yfinance Ticker attribute backing each financial statement
+TICKER_STATEMENT_ATTRIBUTES = {
+    "yearly": {
+        "income_statement": "financials",
+        "balance_sheet": "balance_sheet",
+        "cashflow": "cashflow"
+    },
+    "quarterly": {
+        "income_statement": "quarterly_financials",
+        "balance_sheet": "quarterly_balance_sheet",
+        "cashflow": "quarterly_cashflow"
+    }
+}
+
 # Financial Statement Sheet Names
 FINANCIAL_SHEET_NAMES = {
     "yearly": {
@@ -51,16 +51,14 @@ class StockAnalyzer:
         try:
             # Fetch and filter data
             stock_data = self.yahoo_finance.fetch_stock_data(symbol)
-            print("\n\n\n stock_data ######### ", stock_data )
-            print("\n\n\n ############################# \n\n ")
+            DebugUtils.debug("stock_data:", stock_data)
             filtered_data = self.yahoo_finance.filter_stock_data(stock_data)
 
             # Save filtered data
             self.file_utils.save_filtered_data(symbol, filtered_data, self.output_dir)
             
             # Generate reports
-            word_report_path = self.report_service.generate_word_report(symbol, filtered_data)
-            excel_report_path = self.report_service.generate_excel_report(symbol, filtered_data)
+            word_report_path, excel_report_path = self.report_service.generate_reports(symbol, filtered_data)
             
             # Upload to Google Drive if enabled
             if ENABLE_GOOGLE_DRIVE:
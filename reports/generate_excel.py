@@ -1,93 +1,125 @@
 import os
+import re
 import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
-
-def format_financial_sheet(worksheet, title):
-    """Format the financial sheet with proper styling."""
-    # Format header
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_font = Font(color="FFFFFF", bold=True)
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    # Format title
-    worksheet['A1'] = title
-    worksheet['A1'].font = Font(size=14, bold=True)
-    worksheet.merge_cells('A1:E1')
-    
-    # Format headers
-    for cell in worksheet[2]:
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.border = border
-        cell.alignment = Alignment(horizontal='center')
-    
-    # Format data cells
-    for row in worksheet.iter_rows(min_row=3):
-        for cell in row:
-            cell.border = border
-            cell.alignment = Alignment(horizontal='right')
-    
+import xlsxwriter
+from datetime import date, datetime
+from numbers import Real
+
+SUMMARY_COLUMNS = ["Serial Number", "Stock Name", "Overview", "Summary", "Decision"]
+
+# (statement key, sheet name suffix, title suffix) for each per-stock statement sheet
+FINANCIAL_SHEETS = [
+    ('income_statement', 'Income', 'Income Statement'),
+    ('balance_sheet', 'Balance', 'Balance Sheet'),
+    ('cashflow', 'CashFlow', 'Cash Flow'),
+]
+
+# Excel caps sheet names at 31 characters and rejects these characters in them
+SHEET_NAME_MAX_LENGTH = 31
+INVALID_SHEET_NAME_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+# constant_memory flushes each row to disk as soon as the next one starts
+WORKBOOK_OPTIONS = {'constant_memory': True, 'strings_to_formulas': False}
+
+
+def _cell_value(value):
+    """Convert a value to something xlsxwriter can store, leaving missing values empty."""
+    if isinstance(value, (datetime, date)):
+        return None if pd.isna(value) else str(value)
+    if isinstance(value, (str, Real)):
+        return None if pd.isna(value) else value
+    return None if value is None else str(value)
+
+
+def _sheet_name(name, used_names):
+    """Make a name Excel accepts for a sheet and that no earlier sheet uses.
+
+    Invalid characters are dropped, the name is cut to 31 characters and
+    collisions (which Excel compares case-insensitively) get a "~2", "~3", ... suffix.
+    """
+    base = INVALID_SHEET_NAME_CHARS.sub('', str(name)).strip("'") or 'Sheet'
+    candidate = base[:SHEET_NAME_MAX_LENGTH]
+    counter = 2
+    while candidate.lower() in used_names:
+        suffix = f'~{counter}'
+        candidate = base[:SHEET_NAME_MAX_LENGTH - len(suffix)] + suffix
+        counter += 1
+    used_names.add(candidate.lower())
+    return candidate
+
+
+def _add_formats(workbook):
+    """Create the shared cell formats once per workbook."""
+    return {
+        'title': workbook.add_format({'bold': True, 'font_size': 14}),
+        'header': workbook.add_format({
+            'bold': True,
+            'font_color': '#FFFFFF',
+            'bg_color': '#366092',
+            'border': 1,
+            'align': 'center'
+        }),
+        'data': workbook.add_format({'border': 1, 'align': 'right'}),
+    }
+
+
+def write_financial_sheet(workbook, formats, sheet_name, title, columns, rows):
+    """Write a formatted sheet (title, header row, data rows) top to bottom in one pass.
+
+    constant_memory sheets cannot revisit a row once the next one is started,
+    so column widths are set up front and every cell is formatted as it is written.
+    """
+    worksheet = workbook.add_worksheet(sheet_name)
+    columns = [_cell_value(column) for column in columns]
+    rows = [[_cell_value(value) for value in row] for row in rows]
+
     # Adjust column widths
-    for column in worksheet.columns:
-        max_length = 0
-        column = list(column)
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = (max_length + 2)
-        worksheet.column_dimensions[get_column_letter(column[0].column)].width = adjusted_width
+    for col_idx, column in enumerate(columns):
+        max_length = max(
+            [len(str(column))] + [len(str(row[col_idx])) for row in rows if row[col_idx] is not None]
+        )
+        worksheet.set_column(col_idx, col_idx, max_length + 2)
+
+    worksheet.write(0, 0, title, formats['title'])
+    worksheet.write_row(1, 0, columns, formats['header'])
+    for row_idx, row in enumerate(rows, start=2):
+        worksheet.write_row(row_idx, 0, row, formats['data'])
 
 def generate_excel_report(stock_summaries, excel_filename):
     """Generate an Excel file summarizing stock analysis and financial data."""
-    # Create summary DataFrame
-    df_summary = pd.DataFrame(
-        stock_summaries,
-        columns=["Serial Number", "Stock Name", "Overview", "Summary", "Decision"]
+    workbook = xlsxwriter.Workbook(excel_filename, WORKBOOK_OPTIONS)
+    formats = _add_formats(workbook)
+    used_sheet_names = {'summary'}
+
+    # Write summary sheet
+    write_financial_sheet(
+        workbook,
+        formats,
+        'Summary',
+        "Stock Analysis Summary",
+        SUMMARY_COLUMNS,
+        [stock_data[:len(SUMMARY_COLUMNS)] for stock_data in stock_summaries]
     )
 
-    # Create Excel writer
-    with pd.ExcelWriter(excel_filename, engine='openpyxl') as writer:
-        # Write summary sheet
-        df_summary.to_excel(writer, sheet_name='Summary', index=False)
-        
-        # Format summary sheet
-        summary_sheet = writer.sheets['Summary']
-        format_financial_sheet(summary_sheet, "Stock Analysis Summary")
-        
-        # Process each stock's financial data
-        for stock_data in stock_summaries:
-            if len(stock_data) > 5:  # Check if financial data exists
-                stock_name = stock_data[1]
-                financials = stock_data[5]  # Financial data is at index 5
-                
-                # Create sheets for each financial statement
-                if 'financials' in financials:
-                    # Income Statement
-                    if 'income_statement' in financials['financials']:
-                        income_df = pd.DataFrame(financials['financials']['income_statement'])
-                        income_df.to_excel(writer, sheet_name=f'{stock_name}_Income', index=False)
-                        format_financial_sheet(writer.sheets[f'{stock_name}_Income'], f"{stock_name} - Income Statement")
-                    
-                    # Balance Sheet
-                    if 'balance_sheet' in financials['financials']:
-                        balance_df = pd.DataFrame(financials['financials']['balance_sheet'])
-                        balance_df.to_excel(writer, sheet_name=f'{stock_name}_Balance', index=False)
-                        format_financial_sheet(writer.sheets[f'{stock_name}_Balance'], f"{stock_name} - Balance Sheet")
-                    
-                    # Cash Flow
-                    if 'cashflow' in financials['financials']:
-                        cash_df = pd.DataFrame(financials['financials']['cashflow'])
-                        cash_df.to_excel(writer, sheet_name=f'{stock_name}_CashFlow', index=False)
-                        format_financial_sheet(writer.sheets[f'{stock_name}_CashFlow'], f"{stock_name} - Cash Flow")
+    # Process each stock's financial data
+    for stock_data in stock_summaries:
+        if len(stock_data) > 5:  # Check if financial data exists
+            stock_name = stock_data[1]
+            financials = stock_data[5]  # Financial data is at index 5
+
+            # Create sheets for each financial statement
+            if 'financials' in financials:
+                for statement_key, sheet_suffix, title_suffix in FINANCIAL_SHEETS:
+                    if statement_key in financials['financials']:
+                        statement_df = pd.DataFrame(financials['financials'][statement_key])
+                        write_financial_sheet(
+                            workbook,
+                            formats,
+                            _sheet_name(f'{stock_name}_{sheet_suffix}', used_sheet_names),
+                            f"{stock_name} - {title_suffix}",
+                            list(statement_df.columns),
+                            statement_df.itertuples(index=False, name=None)
+                        )
 
+    workbook.close()
     return excel_filename
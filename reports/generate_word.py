@@ -1,12 +1,20 @@
 from docx import Document
-from datetime import datetime
+import pandas as pd
 import markdown
 from bs4 import BeautifulSoup
 from docx.shared import Pt
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from xml.sax.saxutils import escape
 import re
 
+# Reused Markdown converter; reset() clears its state between documents
+_MD = markdown.Markdown()
+
+# Leading "1." / "2 " numbering that the ListNumber style already supplies
+_OL_PREFIX = re.compile(r'^\d+\.?\s*')
+
 def generate_word_report(stock_symbol, data, gpt_summary, filename):
     """Generate a well-formatted Word document for the stock analysis."""
     doc = Document()
@@ -39,13 +47,18 @@ def generate_word_report(stock_symbol, data, gpt_summary, filename):
     if not news:
         doc.add_paragraph("No recent news available.")
     else:
-        for newsElem in news:
-            article = newsElem.get('content')
-            pub_time = article.get("pubDate", "Unknown Date")
+        articles = [newsElem.get('content') for newsElem in news]
+
+        # Parse every publication date in one vectorized call; missing or bad dates become NaN
+        pub_times = pd.to_datetime(
+            [article.get("pubDate") for article in articles],
+            format="%Y-%m-%dT%H:%M:%SZ",
+            errors="coerce"
+        ).strftime("%Y-%m-%d %H:%M:%S")
 
-            # Convert from string to datetime object
-            if pub_time != "Unknown Date":
-                pub_time = datetime.strptime(pub_time, "%Y-%m-%dT%H:%M:%SZ").strftime("%Y-%m-%d %H:%M:%S")
+        for article, pub_time in zip(articles, pub_times):
+            if not isinstance(pub_time, str):
+                pub_time = "Unknown Date"
 
             # Fix: Apply "List Bullet" correctly
             p = doc.add_paragraph(f" {article.get('title', 'No Title')}")
@@ -63,13 +76,13 @@ def generate_word_report(stock_symbol, data, gpt_summary, filename):
 
 def add_hyperlink(paragraph, url, text):
     """Adds a clickable hyperlink to the Word document."""
-    run = paragraph.add_run(text)
-    run.font.color.rgb = (0, 0, 255)  # Blue color
-    run.underline = True
-    part = paragraph._p
-    hyperlink = OxmlElement("w:hyperlink")
-    hyperlink.set(qn("r:id"), url)
-    part.append(hyperlink)
+    # Register the URL as an external relationship and wrap a blue, underlined run in <w:hyperlink>
+    r_id = paragraph.part.relate_to(url, RT.HYPERLINK, is_external=True)
+    paragraph._p.append(parse_xml(
+        f'<w:hyperlink {nsdecls("w", "r")} r:id="{r_id}"><w:r>'
+        '<w:rPr><w:color w:val="0000FF"/><w:u w:val="single"/></w:rPr>'
+        f'<w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:hyperlink>'
+    ))
 
 
 def process_paragraph(doc, elem):
@@ -93,15 +106,13 @@ def markdown_to_docx(md_text, doc):
     """Converts Markdown to a properly styled Word document."""
 
     # Convert Markdown to HTML
-    html_text = markdown.markdown(md_text)
+    html_text = _MD.reset().convert(md_text)
 
     # Parse HTML
-    soup = BeautifulSoup(html_text, "html.parser")
-
-
+    soup = BeautifulSoup(html_text, "lxml")
 
-    # Process parsed elements
-    for elem in soup.children:
+    # Process parsed elements (lxml wraps the fragment in <html><body>)
+    for elem in (soup.body or soup).children:
         if elem.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
             level = int(elem.name[1])  # Extract heading level (h1 → 1, h2 → 2)
             doc.add_paragraph(elem.text, style=f"Heading {level}")
@@ -121,7 +132,7 @@ def markdown_to_docx(md_text, doc):
 
         elif elem.name == "ol":  # Ordered List
             for li in elem.find_all("li"):
-                text = re.sub(r'^\d+\.?\s*', '', li.text)
+                text = _OL_PREFIX.sub('', li.text)
                 doc.add_paragraph(text, style="ListNumber")
 
 
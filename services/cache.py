@@ -0,0 +1,167 @@
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional, Tuple
+import pandas as pd
+from utils.debug_utils import DebugUtils
+
+
+def is_empty_result(value: Any) -> bool:
+    """Whether a provider result holds no data (the fetchers return empty containers on failure).
+
+    Args:
+        value: Provider result; DataFrames and dicts of them are checked recursively
+
+    Returns:
+        True if there is nothing worth caching
+    """
+    if value is None:
+        return True
+    if isinstance(value, pd.DataFrame):
+        return value.empty
+    if isinstance(value, dict):
+        return all(is_empty_result(item) for item in value.values())
+    return not value
+
+class FileCache:
+    """On-disk cache of provider responses with a time to live per lookup."""
+
+    def __init__(self, cache_dir: Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one sub-directory of entries per symbol
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _entry_path(self, symbol: str, endpoint: str, params: Tuple[Any, ...]) -> Path:
+        """Get the file backing a (symbol, endpoint, params) entry."""
+        digest = hashlib.md5(repr(params).encode("utf-8")).hexdigest()
+        return self.cache_dir / symbol / f"{endpoint}_{digest}.pkl"
+
+    def get(self, symbol: str, endpoint: str, params: Tuple[Any, ...], ttl: float) -> Optional[Any]:
+        """Get a cached value if it is younger than the time to live.
+
+        Args:
+            symbol: Stock symbol the value belongs to
+            endpoint: Name of the provider call, e.g. "financials"
+            params: Extra arguments the value was fetched with
+            ttl: Maximum age of the entry in seconds
+
+        Returns:
+            The cached value, or None if it is missing, expired or unreadable
+        """
+        path = self._entry_path(symbol, endpoint, params)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError) as e:
+            DebugUtils.warning(f"Ignoring unreadable cache entry {path}: {str(e)}")
+            return None
+
+        try:
+            if time.time() - entry["ts"] > ttl:
+                return None
+        except (TypeError, KeyError) as e:
+            DebugUtils.warning(f"Ignoring malformed cache entry {path}: {str(e)}")
+            return None
+        DebugUtils.debug(f"Cache hit: {endpoint} for {symbol}")
+        return entry["data"]
+
+    def set(self, symbol: str, endpoint: str, params: Tuple[Any, ...], data: Any) -> None:
+        """Store a value, replacing any previous entry atomically.
+
+        Args:
+            symbol: Stock symbol the value belongs to
+            endpoint: Name of the provider call, e.g. "financials"
+            params: Extra arguments the value was fetched with
+            data: Value to cache; must be picklable
+        """
+        path = self._entry_path(symbol, endpoint, params)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a uniquely named file next to the target and rename, so readers never see
+        # a partial entry and concurrent writers of the same key never share a temp file
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"ts": time.time(), "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self, symbol: Optional[str] = None) -> None:
+        """Remove cached entries.
+
+        Args:
+            symbol: Only remove this symbol's entries; remove everything if None
+        """
+        target = self.cache_dir / symbol if symbol else self.cache_dir
+        shutil.rmtree(target, ignore_errors=True)
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache whose entries expire after a fixed time to live."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; the least recently used is evicted first
+            ttl: Maximum age of an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """Get a value if it is younger than the time to live.
+
+        Args:
+            key: Entry key; its first element is the stock symbol
+
+        Returns:
+            The cached value, or None if it is missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry[0] > self.ttl:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Tuple[Hashable, ...], data: Any) -> None:
+        """Store a value, evicting the least recently used entries beyond maxsize.
+
+        Args:
+            key: Entry key; its first element is the stock symbol
+            data: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.time(), data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self, symbol: Optional[str] = None) -> None:
+        """Remove cached entries.
+
+        Args:
+            symbol: Only remove this symbol's entries; remove everything if None
+        """
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == symbol]:
+                del self._entries[key]
@@ -1,65 +1,52 @@
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
 
+# (data key, sheet name) for every DataFrame sheet written with its index
+DATAFRAME_SHEETS = [
+    ('yearly_financials', 'Yearly Financials'),
+    ('quarterly_financials', 'Quarterly Financials'),
+    ('yearly_balance_sheet', 'Yearly Balance Sheet'),
+    ('quarterly_balance_sheet', 'Quarterly Balance Sheet'),
+    ('yearly_cashflow', 'Yearly Cash Flow'),
+    ('quarterly_cashflow', 'Quarterly Cash Flow'),
+    ('historical_data', 'Historical Data'),
+]
+
 class ExcelService:
     def generate_excel_report(self, symbol: str, data: Dict[str, Any], filename: Path) -> Path:
         """Generate an Excel report with financial data."""
+        sheets = self._build_sheets(data)
+
         with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            # Company Info
-            info = data.get("info", {})
-            info_df = pd.DataFrame([info])
-            info_df.to_excel(writer, sheet_name='Company Info', index=False)
-            
-            # Yearly Financials
-            if 'yearly_financials' in data:
-                yearly_financials = pd.DataFrame(data['yearly_financials'])
-                yearly_financials.to_excel(writer, sheet_name='Yearly Financials', index=True)
-            
-            # Quarterly Financials
-            if 'quarterly_financials' in data:
-                quarterly_financials = pd.DataFrame(data['quarterly_financials'])
-                quarterly_financials.to_excel(writer, sheet_name='Quarterly Financials', index=True)
-            
-            # Yearly Balance Sheet
-            if 'yearly_balance_sheet' in data:
-                yearly_balance = pd.DataFrame(data['yearly_balance_sheet'])
-                yearly_balance.to_excel(writer, sheet_name='Yearly Balance Sheet', index=True)
-            
-            # Quarterly Balance Sheet
-            if 'quarterly_balance_sheet' in data:
-                quarterly_balance = pd.DataFrame(data['quarterly_balance_sheet'])
-                quarterly_balance.to_excel(writer, sheet_name='Quarterly Balance Sheet', index=True)
-            
-            # Yearly Cash Flow
-            if 'yearly_cashflow' in data:
-                yearly_cash = pd.DataFrame(data['yearly_cashflow'])
-                yearly_cash.to_excel(writer, sheet_name='Yearly Cash Flow', index=True)
-            
-            # Quarterly Cash Flow
-            if 'quarterly_cashflow' in data:
-                quarterly_cash = pd.DataFrame(data['quarterly_cashflow'])
-                quarterly_cash.to_excel(writer, sheet_name='Quarterly Cash Flow', index=True)
-            
-            # Historical Data
-            if 'historical_data' in data:
-                historical = pd.DataFrame(data['historical_data'])
-                historical.to_excel(writer, sheet_name='Historical Data', index=True)
-            
-            # News
-            if 'news' in data:
-                news_data = []
-                for news_item in data['news']:
-                    content = news_item.get('content', {})
-                    news_data.append({
-                        'Title': content.get('title', ''),
-                        'Summary': content.get('summary', ''),
-                        'Source': content.get('provider', {}).get('displayName', ''),
-                        'Published': content.get('pubDate', ''),
-                        'URL': content.get('canonicalUrl', {}).get('url', '')
-                    })
-                news_df = pd.DataFrame(news_data)
-                news_df.to_excel(writer, sheet_name='News', index=False)
-        
-        return filename 
\ No newline at end of file
+            for sheet_name, df, index in sheets:
+                df.to_excel(writer, sheet_name=sheet_name, index=index)
+
+        return filename
+
+    def _build_sheets(self, data: Dict[str, Any]) -> List[Tuple[str, pd.DataFrame, bool]]:
+        """Build every sheet up front as (sheet name, DataFrame, write index)."""
+        # Company Info
+        info = data.get("info", {})
+        sheets = [('Company Info', pd.DataFrame([info]), False)]
+
+        # Financial statements and historical data
+        for key, sheet_name in DATAFRAME_SHEETS:
+            if key in data:
+                sheets.append((sheet_name, pd.DataFrame(data[key]), True))
+
+        # News
+        if 'news' in data:
+            # One list per column, so pandas never re-hashes per-row dict keys
+            contents = [news_item.get('content', {}) for news_item in data['news']]
+            news_df = pd.DataFrame({
+                'Title': [content.get('title', '') for content in contents],
+                'Summary': [content.get('summary', '') for content in contents],
+                'Source': [content.get('provider', {}).get('displayName', '') for content in contents],
+                'Published': [content.get('pubDate', '') for content in contents],
+                'URL': [content.get('canonicalUrl', {}).get('url', '') for content in contents]
+            })
+            sheets.append(('News', news_df, False))
+
+        return sheets
@@ -3,6 +3,7 @@ import numpy as np
 from typing import Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 import yfinance as yf
+from utils.debug_utils import DebugUtils
 
 class PortfolioService:
     def __init__(self):
@@ -61,7 +62,7 @@ class PortfolioService:
     def _calculate_sector_allocation(self, positions: List[Dict[str, Any]]) -> Dict[str, float]:
         """Calculate sector allocation percentages."""
         sector_values = {}
-        print(f"Positions: {positions}")
+        DebugUtils.debug("Positions:", positions)
         total_value = sum(pos['position_value'] for pos in positions)
         
         for position in positions:
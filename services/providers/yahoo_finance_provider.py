@@ -4,8 +4,10 @@ from typing import Dict, Any
 import time
 from datetime import datetime
 import random
+from operator import attrgetter
 from services.stock_data_provider import StockDataProvider
 from config.global_config import GlobalConfig
+from constants.Constants import TICKER_STATEMENT_ATTRIBUTES
 
 class YahooFinanceProvider(StockDataProvider):
     """Yahoo Finance implementation of StockDataProvider."""
@@ -103,31 +105,12 @@ class YahooFinanceProvider(StockDataProvider):
         """Fetch financial statements."""
         stock = self._fetch_with_retry(symbol, yf.Ticker)
 
-        lambda_stock_financials = lambda: stock.financials
-        lambda_stock_balancesheet = lambda: stock.balance_sheet
-        lambda_cashflow = lambda: stock.cashflow
-        lambda_quarterly_financials = lambda: stock.quarterly_financials
-        lambda_quarterly_balance_sheet = lambda: stock.quarterly_cashflow
-        lambda_quarterly_cashflow = lambda: stock.quarterly_cashflow
-
-        lambda_stock_financials.__name__ = "stock.financials"
-        lambda_stock_balancesheet.__name__ = "stock.balance_sheet"
-        lambda_cashflow.__name__ = "stock.cashflow"
-        lambda_quarterly_financials.__name__ = "stock.quarterly_financials"
-        lambda_quarterly_balance_sheet.__name__ = "stock.quarterly_cashflow"
-        lambda_quarterly_cashflow.__name__ = "stock.quarterly_cashflow"
-
         return {
-            'yearly': {
-                'income_statement': self._fetch_with_retry(symbol,lambda_stock_financials),
-                'balance_sheet': self._fetch_with_retry(symbol,lambda_stock_balancesheet),
-                'cashflow': self._fetch_with_retry(symbol,lambda_cashflow)
-            },
-            'quarterly': {
-                'income_statement': self._fetch_with_retry(symbol,lambda_quarterly_financials),
-                'balance_sheet': self._fetch_with_retry(symbol,lambda_quarterly_balance_sheet),
-                'cashflow': self._fetch_with_retry(symbol,lambda_quarterly_cashflow)
+            period: {
+                statement_type: self._fetch_with_retry(symbol, attrgetter(attr), stock)
+                for statement_type, attr in statements.items()
             }
+            for period, statements in TICKER_STATEMENT_ATTRIBUTES.items()
         }
     
     def fetch_company_info(self, symbol: str) -> Dict[str, Any]:
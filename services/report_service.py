@@ -1,14 +1,21 @@
 from docx import Document
-from docx.shared import Pt
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
-import markdown
-from bs4 import BeautifulSoup
+from docx.shared import Pt, Emu
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls
+from docx.text.paragraph import Paragraph
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
 import re
+import math
+import numbers
+import threading
+from xml.sax.saxutils import escape
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
 import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+import numpy as np
 from core.config import OUTPUT_DIR, ENABLE_AI_FEATURES
 from constants.Constants import (
     FINANCIAL_STATEMENT_FILTER_KEYS,
@@ -18,116 +25,245 @@ from constants.Constants import (
 )
 import os
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+# Leading item number left in <ol> item text
+_HTML_LIST_NUMBER = re.compile(r'^\d+\.?\s*')
+
+
+# (data key, heading) for each financial statement table in the Word report
+WORD_STATEMENT_SECTIONS = [
+    ("income_statement", "Income Statement"),
+    ("balance_sheet", "Balance Sheet"),
+    ("cashflow", "Cash Flow Statement"),
+]
+
+# (data key, sheet name, key column header) for the plain key/value analysis sheets
+ANALYSIS_SHEETS = [
+    ('technical_analysis', 'Technical Analysis', 'Indicator'),
+    ('fundamental_analysis', 'Fundamental Analysis', 'Metric'),
+    ('portfolio_analysis', 'Portfolio Analysis', 'Metric'),
+]
+
+# (financials key, sheet name) for each statement sheet, yearly first, then quarterly
+FINANCIAL_STATEMENT_SHEETS = [
+    (key, FINANCIAL_SHEET_NAMES[period][statement_type])
+    for period, statement_keys in FINANCIAL_STATEMENT_FILTER_KEYS.items()
+    for statement_type, key in statement_keys.items()
+]
+
+# (sheet name, key column header, (key, value) rows, value number format)
+KeyValueSheet = Tuple[str, str, Iterable[Tuple[Any, Any]], Optional[str]]
+
+# Excel display format for dates and datetimes in the report workbook
+EXCEL_DATE_FORMAT = "yyyy-mm-dd"
+
+# Excel display format for numeric key metrics, e.g. 1,234,567.89
+METRIC_NUMBER_FORMAT = '#,##0.00'
+
+# Buffer size for report files; the zip writers otherwise hit disk in 8 KiB writes
+REPORT_WRITE_BUFFER = 1 << 20
+
+
+# Markdown instances keep per-conversion state, so each thread gets its own
+_markdown_local = threading.local()
+
+
+def _markdown_converter():
+    """This thread's Markdown instance, imported and built on first use.
+
+    Building the extension chain per call is costly, and Excel-only workers
+    never need markdown at all.
+    """
+    converter = getattr(_markdown_local, "converter", None)
+    if converter is None:
+        import markdown
+        converter = _markdown_local.converter = markdown.Markdown()
+    return converter
+
+
+@lru_cache(maxsize=32)
+def _markdown_to_html(md_text: str) -> str:
+    """Render Markdown to HTML, skipping the conversion for summaries seen before."""
+    return _markdown_converter().reset().convert(md_text)
+
+
+# Raw WordprocessingML for report tables, equivalent to add_table() with the "Table Grid" style
+_TBL_PROPERTIES = (
+    '<w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+    ' w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+)
+
+
+def _build_table_xml(rows: List[List[str]], col_width: int) -> str:
+    """Render rows of cell text as a complete <w:tbl> element with equal column widths."""
+    cell_open = (
+        f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col_width}"/></w:tcPr>'
+        '<w:p><w:r><w:t xml:space="preserve">'
+    )
+    cell_close = '</w:t></w:r></w:p></w:tc>'
+    grid = f'<w:gridCol w:w="{col_width}"/>' * len(rows[0])
+    body = ''.join(
+        '<w:tr>' + ''.join(cell_open + escape(text) + cell_close for text in row) + '</w:tr>'
+        for row in rows
+    )
+    return f'<w:tbl {nsdecls("w")}>{_TBL_PROPERTIES}<w:tblGrid>{grid}</w:tblGrid>{body}</w:tbl>'
+
+
+def _excel_labels(labels: pd.Index) -> pd.Index:
+    """Render datetime axis labels as dates; xlsxwriter would otherwise show serial numbers."""
+    if isinstance(labels, pd.DatetimeIndex):
+        return labels.strftime("%Y-%m-%d")
+    return labels
+
+
 class ReportService:
     """Service for generating stock analysis reports."""
     
     def __init__(self):
         """Initialize the report service."""
-        self.reports_dir = "reports"
-        if not os.path.exists(self.reports_dir):
-            os.makedirs(self.reports_dir)
+        self.reports_dir = Path("reports")
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Jump table for the top-level HTML elements Markdown produces
+        self._html_handlers = {f"h{level}": self._add_html_heading for level in range(1, 7)}
+        self._html_handlers.update({
+            "p": self._process_paragraph,
+            "pre": self._add_html_code_block,
+            "ul": self._add_html_bullet_list,
+            "ol": self._add_html_numbered_list,
+            "blockquote": self._add_html_blockquote,
+            "a": self._add_html_link,
+        })
+    
+    def generate_reports(self, symbol: str, data: Dict[str, Any]) -> Tuple[Path, str]:
+        """Generate the Word and Excel reports for a stock."""
+        return self.generate_word_report(symbol, data), self.generate_excel_report(symbol, data)
     
     def generate_excel_report(self, symbol: str, data: Dict[str, Any]) -> str:
         """Generate an Excel report for a stock."""
         try:
             # Create Excel file path
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            excel_path = os.path.join(self.reports_dir, f"{symbol}_report_{timestamp}.xlsx")
+            excel_path = self.reports_dir / f"{symbol}_report_{timestamp}.xlsx"
             
-            with pd.ExcelWriter(excel_path) as writer:
-                # Write company information
-                if 'info' in data:
-                    self._write_company_info(writer, data['info'])
-                
-                # Write key metrics
-                if 'metrics' in data:
-                    self._write_metrics(writer, data['metrics'])
-                
-                # Write technical analysis
-                if 'technical_analysis' in data:
-                    self._write_technical_analysis(writer, data['technical_analysis'])
-                
-                # Write fundamental analysis
-                if 'fundamental_analysis' in data:
-                    self._write_fundamental_analysis(writer, data['fundamental_analysis'])
-                
-                # Write portfolio analysis
-                if 'portfolio_analysis' in data:
-                    self._write_portfolio_analysis(writer, data['portfolio_analysis'])
+            with open(excel_path, 'wb', buffering=REPORT_WRITE_BUFFER) as excel_file, pd.ExcelWriter(
+                excel_file,
+                engine="xlsxwriter",
+                # The sheets are written through the workbook, not to_excel, so the date format
+                # has to be the workbook default rather than ExcelWriter's datetime_format
+                engine_kwargs={'options': {
+                    'default_date_format': EXCEL_DATE_FORMAT,
+                    'constant_memory': True,
+                    'nan_inf_to_errors': True,
+                    'strings_to_formulas': False,
+                    'strings_to_urls': False
+                }}
+            ) as writer:
+                # Write company information, key metrics and the analysis sections
+                self._write_kv_sheets(writer, self._collect_kv_sheets(data))
                 
                 # Write financial statements
                 if 'financials' in data:
                     self._write_financial_statements(writer, data['financials'])
             
-            return excel_path
+            return str(excel_path)
             
         except Exception as e:
             print(f"Error generating report for {symbol}: {str(e)}")
             raise
     
-    def _write_company_info(self, writer: pd.ExcelWriter, info: Dict[str, Any]) -> None:
-        """Write company information to Excel."""
-        # Create a flat structure for nested dictionaries
-        flat_info = {}
-        for key, value in info.items():
-            if isinstance(value, dict):
-                for subkey, subvalue in value.items():
-                    flat_info[f"{key}_{subkey}"] = subvalue
-            else:
-                flat_info[key] = value
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(list(flat_info.items()), columns=['Metric', 'Value'])
-        df.to_excel(writer, sheet_name='Company Info', index=False)
-    
-    def _write_metrics(self, writer: pd.ExcelWriter, metrics: Dict[str, Any]) -> None:
-        """Write key metrics to Excel."""
-        # Convert metrics to DataFrame
-        df = pd.DataFrame(list(metrics.items()), columns=['Metric', 'Value'])
-        
-        # Format numeric values
-        df['Value'] = pd.to_numeric(df['Value'], errors='ignore')
-        numeric_mask = pd.to_numeric(df['Value'], errors='coerce').notna()
-        df.loc[numeric_mask, 'Value'] = df.loc[numeric_mask, 'Value'].apply(
-            lambda x: f"{x:,.2f}" if abs(x) >= 1000 else f"{x:.2f}"
+    def _collect_kv_sheets(self, data: Dict[str, Any]) -> List[KeyValueSheet]:
+        """Gather every key/value sheet as (sheet name, key header, rows, value number format)."""
+        sheets = []
+        if 'info' in data:
+            sheets.append(('Company Info', 'Metric', self._company_info_rows(data['info']), None))
+        if 'metrics' in data:
+            sheets.append(('Key Metrics', 'Metric', self._metric_rows(data['metrics']), METRIC_NUMBER_FORMAT))
+        sheets.extend(
+            (sheet_name, key_label, data[key].items(), None)
+            for key, sheet_name, key_label in ANALYSIS_SHEETS
+            if key in data
         )
-        
-        df.to_excel(writer, sheet_name='Key Metrics', index=False)
+        return sheets
     
-    def _write_technical_analysis(self, writer: pd.ExcelWriter, analysis: Dict[str, Any]) -> None:
-        """Write technical analysis to Excel."""
-        df = pd.DataFrame(list(analysis.items()), columns=['Indicator', 'Value'])
-        df.to_excel(writer, sheet_name='Technical Analysis', index=False)
+    def _company_info_rows(self, info: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+        """Company information with nested dictionaries flattened into underscore-joined keys."""
+        # Depth-first over a stack of item iterators, so rows keep the original key order
+        stack = [("", iter(info.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
+                path = f"{prefix}{key}"
+                if isinstance(value, dict):
+                    stack.append((f"{path}_", iter(value.items())))
+                    break
+                yield path, value
+            else:
+                stack.pop()
     
-    def _write_fundamental_analysis(self, writer: pd.ExcelWriter, analysis: Dict[str, Any]) -> None:
-        """Write fundamental analysis to Excel."""
-        df = pd.DataFrame(list(analysis.items()), columns=['Metric', 'Value'])
-        df.to_excel(writer, sheet_name='Fundamental Analysis', index=False)
+    def _metric_rows(self, metrics: Dict[str, Any]) -> Iterable[Tuple[Any, Any]]:
+        """Key metrics with numeric values kept as numbers; Excel applies the display format."""
+        values = pd.Series(metrics, dtype=object)
+        numeric = pd.to_numeric(values, errors='coerce')
+        values[numeric.notna()] = numeric[numeric.notna()]
+        return values.items()
     
-    def _write_portfolio_analysis(self, writer: pd.ExcelWriter, analysis: Dict[str, Any]) -> None:
-        """Write portfolio analysis to Excel."""
-        df = pd.DataFrame(list(analysis.items()), columns=['Metric', 'Value'])
-        df.to_excel(writer, sheet_name='Portfolio Analysis', index=False)
+    def _write_kv_sheets(self, writer: pd.ExcelWriter,
+                         sheets: List[KeyValueSheet]) -> None:
+        """Write Metric/Value style sheets straight to the workbook without building DataFrames."""
+        book = writer.book
+        
+        # Formats are workbook-wide; create each one once and share it across sheets
+        header_format = book.add_format({'bold': True})
+        number_formats = {
+            number_format: book.add_format({'num_format': number_format})
+            for number_format in {sheet[3] for sheet in sheets}
+            if number_format
+        }
+        
+        for sheet_name, key_label, rows, number_format in sheets:
+            ws = book.add_worksheet(sheet_name)
+            ws.write_row(0, 0, [key_label, 'Value'], header_format)
+            value_format = number_formats.get(number_format)
+            
+            # Typed writes skip xlsxwriter's generic type, URL and formula detection
+            for row_idx, (key, value) in enumerate(rows, start=1):
+                ws.write_string(row_idx, 0, str(key))
+                if isinstance(value, bool):
+                    ws.write_boolean(row_idx, 1, value)
+                elif isinstance(value, numbers.Real):
+                    if not math.isnan(value):
+                        ws.write_number(row_idx, 1, value, value_format)
+                elif value is not None:
+                    ws.write_string(row_idx, 1, str(value))
     
     def _write_financial_statements(self, writer: pd.ExcelWriter, financials: Dict[str, Any]) -> None:
         """Write financial statements to Excel."""
-        # Write yearly statements
-        for statement_type in ['income_statement', 'balance_sheet', 'cashflow']:
-            key = FINANCIAL_STATEMENT_FILTER_KEYS['yearly'][statement_type]
-            if key in financials and not financials[key].empty:
-                financials[key].to_excel(
-                    writer,
-                    sheet_name=FINANCIAL_SHEET_NAMES['yearly'][statement_type]
-                )
+        for key, sheet_name in FINANCIAL_STATEMENT_SHEETS:
+            statement = financials.get(key)
+            if statement is None:
+                continue
+            
+            # yfinance pads statements with empty line items and periods; skip writing them
+            statement = statement.dropna(how='all').dropna(axis=1, how='all')
+            if not statement.empty:
+                self._write_dataframe_sheet(writer, sheet_name, statement)
+    
+    def _write_dataframe_sheet(self, writer: pd.ExcelWriter, sheet_name: str, df: pd.DataFrame) -> None:
+        """Write a DataFrame and its index row by row, bypassing pandas' per-cell formatter."""
+        ws = writer.book.add_worksheet(sheet_name)
+        ws.write_row(0, 0, [df.index.name, *_excel_labels(df.columns)])
         
-        # Write quarterly statements
-        for statement_type in ['income_statement', 'balance_sheet', 'cashflow']:
-            key = FINANCIAL_STATEMENT_FILTER_KEYS['quarterly'][statement_type]
-            if key in financials and not financials[key].empty:
-                financials[key].to_excel(
-                    writer,
-                    sheet_name=FINANCIAL_SHEET_NAMES['quarterly'][statement_type]
-                )
+        # Missing values become empty cells, as with to_excel's default na_rep
+        values = df.astype(object).where(df.notna(), None)
+        values.index = _excel_labels(df.index)
+        # constant_memory writes strings inline rather than through the shared-strings table,
+        # so repeated line-item labels are stored once per cell, not de-duplicated
+        for row_idx, row in enumerate(values.itertuples(name=None), start=1):
+            ws.write_row(row_idx, 0, row)
 
     def generate_word_report(self, symbol: str, data: Dict[str, Any]) -> Path:
         """Generate a Word report for the stock analysis."""
@@ -139,21 +275,14 @@ class ReportService:
         # Add company info
         if "info" in data:
             doc.add_heading("Company Information", level=1)
-            for key, value in data["info"].items():
-                doc.add_paragraph(f"{key}: {value}")
+            self._add_paragraphs(doc, [f"{key}: {value}" for key, value in data["info"].items()])
         
         # Add financial statements
-        if "income_statement" in data and not data["income_statement"].empty:
-            doc.add_heading("Income Statement", level=1)
-            self._add_dataframe_to_doc(doc, data["income_statement"])
-        
-        if "balance_sheet" in data and not data["balance_sheet"].empty:
-            doc.add_heading("Balance Sheet", level=1)
-            self._add_dataframe_to_doc(doc, data["balance_sheet"])
-        
-        if "cashflow" in data and not data["cashflow"].empty:
-            doc.add_heading("Cash Flow Statement", level=1)
-            self._add_dataframe_to_doc(doc, data["cashflow"])
+        for key, heading in WORD_STATEMENT_SECTIONS:
+            statement = data.get(key)
+            if statement is not None and not statement.empty:
+                doc.add_heading(heading, level=1)
+                self._add_dataframe_to_doc(doc, statement)
         
         # Add AI summary if available
         if ENABLE_AI_FEATURES and "summary" in data and data["summary"]:
@@ -161,34 +290,49 @@ class ReportService:
             doc.add_paragraph(data["summary"])
         
         # Save the document
-        output_path = os.path.join(self.reports_dir, f"{symbol}_Analysis_Report.docx")
+        output_path = self.reports_dir / f"{symbol}_Analysis_Report.docx"
 
-        doc.save(str(output_path))
+        with open(output_path, 'wb', buffering=REPORT_WRITE_BUFFER) as docx_file:
+            doc.save(docx_file)
         
         return output_path
     
+    def _add_paragraphs(self, doc: Document, lines: List[str]) -> None:
+        """Add plain paragraphs, locating the body's section properties only once."""
+        body = doc.element.body
+        sect_pr = body.sectPr
+        for line in lines:
+            p = OxmlElement("w:p")
+            if sect_pr is not None:
+                sect_pr.addprevious(p)
+            else:
+                body.append(p)
+            Paragraph(p, doc._body).add_run(line)
+
     def _add_dataframe_to_doc(self, doc: Document, df: pd.DataFrame) -> None:
         """Add a DataFrame to a Word document."""
         if df.empty:
             doc.add_paragraph("No data available")
             return
         
-        # Convert DataFrame to table
-        table = doc.add_table(rows=1, cols=len(df.columns) + 1)
-        table.style = 'Table Grid'
+        # Format all cells up front; all-numeric statements are formatted in C by numpy
+        if all(is_numeric_dtype(dtype) and not is_bool_dtype(dtype) for dtype in df.dtypes):
+            values = np.char.mod('%.2f', df.to_numpy(dtype=np.float64, na_value=np.nan))
+        else:
+            values = df.astype(str).to_numpy()
         
-        # Add headers
-        header_cells = table.rows[0].cells
-        header_cells[0].text = "Metric"
-        for i, col in enumerate(df.columns):
-            header_cells[i + 1].text = str(col)
+        # Header row, then one row per index label
+        header = ["Metric", *map(str, df.columns)]
+        body = np.column_stack([df.index.astype(str).to_numpy(), values])
         
-        # Add data
-        for idx, row in df.iterrows():
-            row_cells = table.add_row().cells
-            row_cells[0].text = str(idx)
-            for i, value in enumerate(row):
-                row_cells[i + 1].text = str(value)
+        # Split the text width evenly across columns, as doc.add_table does
+        section = doc.sections[-1]
+        text_width = section.page_width - section.left_margin - section.right_margin
+        col_width = Emu(text_width // len(header)).twips
+        
+        # Parse the whole table once and insert it ahead of the section properties
+        tbl = parse_xml(_build_table_xml([header, *body.tolist()], col_width))
+        doc.element.body._insert_tbl(tbl)
 
     def _add_company_overview(self, doc: Document, data: Dict[str, Any]) -> None:
         """Add company overview section to the document."""
@@ -206,9 +350,7 @@ class ReportService:
             ("Website", "website")
         ]
 
-        for label, key in overview_fields:
-            value = info.get(key, 'N/A')
-            doc.add_paragraph().add_run(f"{label}: ").add_text(str(value))
+        self._add_paragraphs(doc, [f"{label}: {info.get(key, 'N/A')}" for label, key in overview_fields])
 
     def _add_news_section(self, doc: Document, data: Dict[str, Any]) -> None:
         """Add news section to the document."""
@@ -219,53 +361,78 @@ class ReportService:
             doc.add_paragraph("No recent news available.")
             return
 
-        for news_elem in news:
-            article = news_elem.get('content', {})
-            pub_time = article.get("pubDate", "Unknown Date")
+        articles = [news_elem.get('content', {}) for news_elem in news]
+
+        # Parse every publication date in one vectorized call; missing or bad dates become NaN
+        pub_times = pd.to_datetime(
+            [article.get("pubDate") for article in articles],
+            format="%Y-%m-%dT%H:%M:%SZ",
+            errors="coerce"
+        ).strftime("%Y-%m-%d %H:%M:%S")
 
-            if pub_time != "Unknown Date":
-                pub_time = datetime.strptime(pub_time, "%Y-%m-%dT%H:%M:%SZ").strftime("%Y-%m-%d %H:%M:%S")
+        add_paragraph = doc.add_paragraph
+        for article, pub_time in zip(articles, pub_times):
+            if not isinstance(pub_time, str):
+                pub_time = "Unknown Date"
 
-            p = doc.add_paragraph(f" {article.get('title', 'No Title')}")
+            p = add_paragraph(f" {article.get('title', 'No Title')}")
             p.style = "List Bullet"
 
-            doc.add_paragraph(f"  {article.get('summary', 'Unknown')}")
-            doc.add_paragraph(f"  Source: {article.get('provider', {}).get('displayName', 'Unknown')}")
-            doc.add_paragraph(f"  Published: {pub_time}")
-            doc.add_paragraph(f"  URL: {article.get('canonicalUrl', {}).get('url', 'Unknown')}\n")
+            add_paragraph(f"  {article.get('summary', 'Unknown')}")
+            add_paragraph(f"  Source: {article.get('provider', {}).get('displayName', 'Unknown')}")
+            add_paragraph(f"  Published: {pub_time}")
+            add_paragraph(f"  URL: {article.get('canonicalUrl', {}).get('url', 'Unknown')}\n")
 
     def _markdown_to_docx(self, md_text: str, doc: Document) -> None:
         """Convert Markdown to Word document format."""
-        html_text = markdown.markdown(md_text)
-        soup = BeautifulSoup(html_text, "html.parser")
-
-        for elem in soup.children:
-            if elem.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-                level = int(elem.name[1])
-                doc.add_paragraph(elem.text, style=f"Heading {level}")
-            elif elem.name == "p":
-                self._process_paragraph(doc, elem)
-            elif elem.name == "pre":
-                p = doc.add_paragraph()
-                run = p.add_run(elem.text.strip())
-                run.font.name = "Courier New"
-            elif elem.name == "ul":
-                for li in elem.find_all("li"):
-                    doc.add_paragraph(li.text, style="ListBullet")
-            elif elem.name == "ol":
-                for li in elem.find_all("li"):
-                    text = re.sub(r'^\d+\.?\s*', '', li.text)
-                    doc.add_paragraph(text, style="ListNumber")
-            elif elem.name == "blockquote":
-                p = doc.add_paragraph()
-                run = p.add_run(elem.text)
-                p.paragraph_format.left_indent = Pt(20)
-                run.italic = True
-            elif elem.name == "a":
-                p = doc.add_paragraph()
-                self._add_hyperlink(p, elem["href"], elem.text)
+        # Imported here so reports without a summary never load bs4
+        from bs4 import BeautifulSoup
+
+        html_text = _markdown_to_html(md_text)
+        soup = BeautifulSoup(html_text, "lxml")
+
+        # lxml wraps the fragment in <html><body>
+        handlers = self._html_handlers
+        for elem in (soup.body or soup).children:
+            handler = handlers.get(elem.name)
+            if handler:
+                handler(doc, elem)
+
+    def _add_html_heading(self, doc: Document, elem: "BeautifulSoup") -> None:
+        """Add an <h1>-<h6> element as a Word heading."""
+        level = int(elem.name[1])
+        doc.add_paragraph(elem.text, style=f"Heading {level}")
+
+    def _add_html_code_block(self, doc: Document, elem: "BeautifulSoup") -> None:
+        """Add a <pre> element in a monospaced run."""
+        p = doc.add_paragraph()
+        run = p.add_run(elem.text.strip())
+        run.font.name = "Courier New"
+
+    def _add_html_bullet_list(self, doc: Document, elem: "BeautifulSoup") -> None:
+        """Add each <li> of a <ul> as a bullet item."""
+        for li in elem.find_all("li"):
+            doc.add_paragraph(li.text, style="ListBullet")
+
+    def _add_html_numbered_list(self, doc: Document, elem: "BeautifulSoup") -> None:
+        """Add each <li> of an <ol> as a numbered item."""
+        for li in elem.find_all("li"):
+            text = _HTML_LIST_NUMBER.sub('', li.text)
+            doc.add_paragraph(text, style="ListNumber")
+
+    def _add_html_blockquote(self, doc: Document, elem: "BeautifulSoup") -> None:
+        """Add a <blockquote> as an indented italic paragraph."""
+        p = doc.add_paragraph()
+        run = p.add_run(elem.text)
+        p.paragraph_format.left_indent = Pt(20)
+        run.italic = True
+
+    def _add_html_link(self, doc: Document, elem: "BeautifulSoup") -> None:
+        """Add a top-level <a> as a hyperlink paragraph."""
+        p = doc.add_paragraph()
+        self._add_hyperlink(p, elem["href"], elem.text)
 
-    def _process_paragraph(self, doc: Document, elem: BeautifulSoup) -> None:
+    def _process_paragraph(self, doc: Document, elem: "BeautifulSoup") -> None:
         """Process a paragraph with mixed formatting."""
         p = doc.add_paragraph()
         for part in elem.contents:
@@ -281,12 +448,12 @@ class ReportService:
             else:
                 run = p.add_run(part)
 
-    def _add_hyperlink(self, paragraph: Document, url: str, text: str) -> None:
+    def _add_hyperlink(self, paragraph: Paragraph, url: str, text: str) -> None:
         """Add a clickable hyperlink to the document."""
-        run = paragraph.add_run(text)
-        run.font.color.rgb = (0, 0, 255)
-        run.underline = True
-        part = paragraph._p
-        hyperlink = OxmlElement("w:hyperlink")
-        hyperlink.set(qn("r:id"), url)
-        part.append(hyperlink) 
\ No newline at end of file
+        # relate_to reuses the existing relationship when the URL is already linked
+        r_id = paragraph.part.relate_to(url, RT.HYPERLINK, is_external=True)
+        paragraph._p.append(parse_xml(
+            f'<w:hyperlink {nsdecls("w", "r")} r:id="{r_id}"><w:r>'
+            '<w:rPr><w:color w:val="0000FF"/><w:u w:val="single"/></w:rPr>'
+            f'<w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:hyperlink>'
+        ))
@@ -29,6 +29,10 @@ class StockDataProvider(ABC):
         """Fetch historical price data."""
         pass
     
+    def fetch_historical_data_batch(self, symbols: List[str], period: str = "1y", interval: str = "1d") -> Dict[str, pd.DataFrame]:
+        """Fetch historical price data for many symbols; providers with a batch endpoint override this."""
+        return {symbol: self.fetch_historical_data(symbol, period, interval) for symbol in symbols}
+    
     @abstractmethod
     def fetch_financials(self, symbol: str) -> Dict[str, Any]:
         """Fetch financial statements."""
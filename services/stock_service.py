@@ -1,39 +1,130 @@
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import pandas as pd
 from services.stock_data_factory import StockDataFactory
+from services.cache import FileCache, MemoryCache, is_empty_result
+from config.settings import Settings
 from models.stock_data import StockData, CompanyInfo, FinancialMetrics, TechnicalIndicators, TechnicalSignals, FinancialStatements, NewsItem
 from utils.debug_utils import DebugUtils
 import random
+import threading
 import time
 from services.yahoo_finance.yahoo_finance_service import YahooFinanceService
 
+# Maximum number of tickers requested together by fetch_historical_data_batch
+HISTORY_BATCH_SIZE = 20
+
+# fetch_stock_data results kept in memory: most recent symbols, reused for TTL seconds
+STOCK_DATA_CACHE_SIZE = 128
+STOCK_DATA_CACHE_TTL = 60
+
+# Historical bars kept in memory per (symbol, period, interval), so the chart,
+# indicators and signals on one page share a single download
+HISTORY_CACHE_SIZE = 256
+HISTORY_CACHE_TTL = 300
+
+# Sections of a fetch_stock_data result that hold fetched data
+STOCK_DATA_SECTIONS = ('history', 'financials', 'info', 'news')
+
+# Client errors worth retrying: request timeout, too early, too many requests
+RETRYABLE_CLIENT_STATUSES = {408, 425, 429}
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """HTTP status of the response attached to an exception, if any."""
+    return getattr(getattr(error, "response", None), "status_code", None)
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Delay requested by the server's Retry-After header, in seconds or as an HTTP date."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _copy_stock_data(value: Any) -> Any:
+    """Copy the DataFrames, dicts and lists of a fetch_stock_data result, so callers never share them."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, dict):
+        return {key: _copy_stock_data(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_stock_data(item) for item in value]
+    return value
+
+
+def _is_complete_stock_data(data: Any) -> bool:
+    """Whether a fetch_stock_data result is worth caching: no errors and at least one non-empty section."""
+    if data is None:
+        return False
+    if not isinstance(data, dict):
+        return True
+    if data.get('errors'):
+        return False
+    return not all(is_empty_result(data.get(key)) for key in STOCK_DATA_SECTIONS)
+
+
 class StockService:
     """Service for fetching stock data from various providers."""
     
     _instance = None
     _initialized = False
+    _instance_lock = threading.Lock()
+    
+    # In-memory results shared by the singleton
+    _stock_data_cache = MemoryCache(STOCK_DATA_CACHE_SIZE, STOCK_DATA_CACHE_TTL)
+    _history_cache = MemoryCache(HISTORY_CACHE_SIZE, HISTORY_CACHE_TTL)
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(StockService, cls).__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super(StockService, cls).__new__(cls)
         return cls._instance
     
     def __init__(self):
         """Initialize the stock service."""
-        # Only initialize once
+        # Only initialize once; the lock keeps concurrent first calls from both initializing
         if StockService._initialized:
             return
-            
-        self._debug = DebugUtils()
-        self._provider = StockDataFactory.get_provider('yahoo_finance')
-        self._debug.log_info(f"Initialized StockService with provider: {self._provider.get_provider_name()}")
-        StockService._initialized = True
+        
+        with StockService._instance_lock:
+            if StockService._initialized:
+                return
+            self._debug = DebugUtils()
+            self._provider = StockDataFactory.get_provider('yahoo_finance')
+            # The provider caches its results here; kept so clear_cache can drop them
+            self._cache = FileCache(Settings.CACHE_DIR)
+            self._debug.log_info(f"Initialized StockService with provider: {self._provider.get_provider_name()}")
+            StockService._initialized = True
     
     def _debug_print(self, *args, **kwargs):
         """Print debug messages only if debug mode is enabled."""
         self._debug.debug(*args, **kwargs)
 
+    def clear_cache(self, symbol: Optional[str] = None) -> None:
+        """Drop cached provider results, on disk and in memory.
+        
+        Args:
+            symbol: Only drop this symbol's results; drop everything if None
+        """
+        self._cache.clear(symbol)
+        StockService._stock_data_cache.clear(symbol)
+        StockService._history_cache.clear(symbol)
+
     def fetch_stock_data(self, symbol: str) -> StockData:
         """Fetch stock data for a symbol.
         
@@ -43,8 +134,17 @@ class StockService:
         Returns:
             StockData object containing the fetched data
         """
+        cached = StockService._stock_data_cache.get((symbol,))
+        if cached is not None:
+            # Hand out copies so one caller's edits never leak into the cached entry
+            return _copy_stock_data(cached)
+        
         self._debug.info(f"Fetching stock data for {symbol}")
-        return self._provider.fetch_stock_data(symbol)
+        data = self._provider.fetch_stock_data(symbol)
+        # A partial or failed fetch would otherwise be served for the whole TTL
+        if _is_complete_stock_data(data):
+            StockService._stock_data_cache.set((symbol,), _copy_stock_data(data))
+        return data
 
     def fetch_historical_data(self, symbol: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
         """Fetch historical price data.
@@ -58,7 +158,46 @@ class StockService:
             DataFrame containing historical price data
         """
         self._debug.info(f"Fetching historical data for {symbol} (period={period}, interval={interval})")
-        return self._provider.fetch_historical_data(symbol, period, interval)
+        return self.fetch_historical_data_batch([symbol], period, interval)[symbol]
+    
+    def fetch_historical_data_batch(self, symbols: List[str], period: str = "1y", interval: str = "1d") -> Dict[str, pd.DataFrame]:
+        """Fetch historical price data for many symbols with one download per batch.
+        
+        Args:
+            symbols: Stock symbols to fetch data for
+            period: Time period to fetch (default: "1y")
+            interval: Data interval (default: "1d")
+            
+        Returns:
+            Dictionary mapping each symbol to its historical price data;
+            symbols Yahoo Finance returned nothing for map to an empty DataFrame
+        """
+        # Serve recently downloaded bars from memory and only download the rest
+        history = {}
+        missing = []
+        for symbol in symbols:
+            cached = StockService._history_cache.get((symbol, period, interval))
+            if cached is not None:
+                # Hand out copies so one caller's edits never leak into another's frame
+                history[symbol] = cached.copy()
+            else:
+                missing.append(symbol)
+        
+        for start in range(0, len(missing), HISTORY_BATCH_SIZE):
+            batch = missing[start:start + HISTORY_BATCH_SIZE]
+            self._debug.info(f"Fetching historical data for {len(batch)} symbols (period={period}, interval={interval})")
+            fetched = self._fetch_with_retry(
+                ",".join(batch),
+                self._provider.fetch_historical_data_batch,
+                batch,
+                period,
+                interval
+            )
+            for symbol in batch:
+                history[symbol] = fetched[symbol]
+                if not history[symbol].empty:
+                    StockService._history_cache.set((symbol, period, interval), history[symbol].copy())
+        return history
     
     def fetch_financials(self, symbol: str) -> Dict[str, Any]:
         """Fetch financial statements.
@@ -139,8 +278,16 @@ class StockService:
                     self._debug.error(f"Max retries ({max_retries}) reached for {api_call.__name__}")
                     raise
                     
-                if "Too Many Requests" in str(e):
-                    wait_time = base_delay * (2 ** (attempt - 1)) + random.uniform(0, 1)
+                status = _status_code(e)
+                if status is not None and 400 <= status < 500 and status not in RETRYABLE_CLIENT_STATUSES:
+                    self._debug.error(f"Error in {api_call.__name__}: {str(e)}")
+                    raise
+                    
+                if status == 429 or "Too Many Requests" in str(e):
+                    # Prefer the server's own hint over guessing with exponential backoff
+                    wait_time = _retry_after_seconds(e)
+                    if wait_time is None:
+                        wait_time = base_delay * (2 ** (attempt - 1)) + random.uniform(0, 1)
                     self._debug.warning(f"Rate limit hit. Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                 else:
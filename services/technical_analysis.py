@@ -1,8 +1,19 @@
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from typing import Dict, Any, Tuple, List
+from typing import TYPE_CHECKING, Dict, Any, Tuple, List
+from utils.debug_utils import DebugUtils
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Above this many rows, line traces are drawn with WebGL instead of SVG
+CHART_WEBGL_THRESHOLD = 1000
+
+# Above this many daily bars, the candlestick shows weekly bars instead
+CHART_MAX_CANDLES = 1500
+
+# How daily OHLC columns combine into one weekly candle
+WEEKLY_OHLC = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last'}
 
 class TechnicalAnalysisService:
     def __init__(self):
@@ -12,103 +23,119 @@ class TechnicalAnalysisService:
     def calculate_technical_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate technical indicators for the given DataFrame."""
         # Ensure we have the required columns
-        print("df ===========: ",df)
+        DebugUtils.debug("calculate_technical_indicators df:", df)
         if 'Close' not in df.columns or 'Volume' not in df.columns:
             return df
         
+        close = df['Close']
+        indicators = {}
+        
+        # SMA 20 and the Bollinger Bands share one 20-day window
+        window_20 = close.rolling(window=20)
+        
         # Calculate Moving Averages
-        df['SMA_20'] = df['Close'].rolling(window=20).mean()
-        df['SMA_50'] = df['Close'].rolling(window=50).mean()
-        df['EMA_20'] = df['Close'].ewm(span=20, adjust=False).mean()
+        indicators['SMA_20'] = window_20.mean()
+        indicators['SMA_50'] = close.rolling(window=50).mean()
+        indicators['EMA_20'] = close.ewm(span=20, adjust=False).mean()
         
         # Calculate RSI
-        delta = df['Close'].diff()
+        delta = close.diff()
         gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
         loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
         rs = gain / loss
-        df['RSI'] = 100 - (100 / (1 + rs))
+        indicators['RSI'] = 100 - (100 / (1 + rs))
         
         # Calculate MACD
-        exp1 = df['Close'].ewm(span=12, adjust=False).mean()
-        exp2 = df['Close'].ewm(span=26, adjust=False).mean()
-        df['MACD'] = exp1 - exp2
-        df['Signal_Line'] = df['MACD'].ewm(span=9, adjust=False).mean()
+        exp1 = close.ewm(span=12, adjust=False).mean()
+        exp2 = close.ewm(span=26, adjust=False).mean()
+        indicators['MACD'] = exp1 - exp2
+        indicators['Signal_Line'] = indicators['MACD'].ewm(span=9, adjust=False).mean()
         
         # Calculate Bollinger Bands
-        df['BB_Middle'] = df['Close'].rolling(window=20).mean()
-        bb_std = df['Close'].rolling(window=20).std()
-        df['BB_Upper'] = df['BB_Middle'] + (bb_std * 2)
-        df['BB_Lower'] = df['BB_Middle'] - (bb_std * 2)
+        indicators['BB_Middle'] = indicators['SMA_20']
+        bb_std = window_20.std()
+        indicators['BB_Upper'] = indicators['BB_Middle'] + (bb_std * 2)
+        indicators['BB_Lower'] = indicators['BB_Middle'] - (bb_std * 2)
         
         # Calculate Volume indicators
-        df['Volume_SMA'] = df['Volume'].rolling(window=20).mean()
+        indicators['Volume_SMA'] = df['Volume'].rolling(window=20).mean()
         
-        return df
+        # Attach every indicator in one step instead of growing the frame column by column
+        return df.assign(**indicators)
     
-    def create_price_chart(self, df: pd.DataFrame, symbol: str) -> go.Figure:
+    def create_price_chart(self, df: pd.DataFrame, symbol: str) -> "go.Figure":
         """Create an interactive price chart with technical indicators."""
+        # plotly is only needed for charts; keep it out of the indicator/signal import path
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         fig = make_subplots(rows=4, cols=1, 
                            shared_xaxes=True,
                            vertical_spacing=0.05,
                            row_heights=[0.5, 0.25, 0.25, 0.25])
         
-        # Candlestick chart
-        print("df ######## ",df)
-        fig.add_trace(go.Candlestick(x=df.index,
-                                    open=df['Open'],
-                                    high=df['High'],
-                                    low=df['Low'],
-                                    close=df['Close'],
-                                    name='Price'),
-                     row=1, col=1)
-        
-        # Add moving averages
-        fig.add_trace(go.Scatter(x=df.index, y=df['SMA_20'],
-                               name='SMA 20',
-                               line=dict(color='blue')),
-                     row=1, col=1)
-        fig.add_trace(go.Scatter(x=df.index, y=df['SMA_50'],
-                               name='SMA 50',
-                               line=dict(color='orange')),
-                     row=1, col=1)
-        
-        # Add Bollinger Bands
-        fig.add_trace(go.Scatter(x=df.index, y=df['BB_Upper'],
-                               name='BB Upper',
-                               line=dict(color='gray', dash='dash')),
-                     row=1, col=1)
-        fig.add_trace(go.Scatter(x=df.index, y=df['BB_Lower'],
-                               name='BB Lower',
-                               line=dict(color='gray', dash='dash')),
-                     row=1, col=1)
-        
-        # Volume chart
-        fig.add_trace(go.Bar(x=df.index, y=df['Volume'],
-                           name='Volume'),
-                     row=2, col=1)
-        fig.add_trace(go.Scatter(x=df.index, y=df['Volume_SMA'],
-                               name='Volume SMA',
-                               line=dict(color='orange')),
-                     row=2, col=1)
-        
-        # RSI chart
-        fig.add_trace(go.Scatter(x=df.index, y=df['RSI'],
-                               name='RSI',
-                               line=dict(color='purple')),
-                     row=3, col=1)
+        DebugUtils.debug("create_price_chart df:", df)
+        
+        # Long histories: one SVG path per candle and per line point is slow to render
+        candles = df
+        if len(df) > CHART_MAX_CANDLES and isinstance(df.index, pd.DatetimeIndex):
+            candles = df.resample('W').agg(WEEKLY_OHLC).dropna(how='all')
+        scatter = go.Scattergl if len(df) > CHART_WEBGL_THRESHOLD else go.Scatter
+        
+        traces = [
+            # Candlestick chart
+            go.Candlestick(x=candles.index,
+                           open=candles['Open'],
+                           high=candles['High'],
+                           low=candles['Low'],
+                           close=candles['Close'],
+                           name='Price'),
+            
+            # Add moving averages
+            scatter(x=df.index, y=df['SMA_20'],
+                    name='SMA 20',
+                    line=dict(color='blue')),
+            scatter(x=df.index, y=df['SMA_50'],
+                    name='SMA 50',
+                    line=dict(color='orange')),
+            
+            # Add Bollinger Bands
+            scatter(x=df.index, y=df['BB_Upper'],
+                    name='BB Upper',
+                    line=dict(color='gray', dash='dash')),
+            scatter(x=df.index, y=df['BB_Lower'],
+                    name='BB Lower',
+                    line=dict(color='gray', dash='dash')),
+            
+            # Volume chart
+            go.Bar(x=df.index, y=df['Volume'],
+                   name='Volume'),
+            scatter(x=df.index, y=df['Volume_SMA'],
+                    name='Volume SMA',
+                    line=dict(color='orange')),
+            
+            # RSI chart
+            scatter(x=df.index, y=df['RSI'],
+                    name='RSI',
+                    line=dict(color='purple')),
+            
+            # MACD chart
+            scatter(x=df.index, y=df['MACD'],
+                    name='MACD',
+                    line=dict(color='blue')),
+            scatter(x=df.index, y=df['Signal_Line'],
+                    name='Signal Line',
+                    line=dict(color='orange')),
+        ]
+        
+        # Subplot row of each trace above; one add_traces call validates them all together
+        trace_rows = [1, 1, 1, 1, 1, 2, 2, 3, 4, 4]
+        fig.add_traces(traces, rows=trace_rows, cols=[1] * len(traces))
+        
+        # RSI thresholds
         fig.add_hline(y=70, line_dash="dash", line_color="red", row=3, col=1)
         fig.add_hline(y=30, line_dash="dash", line_color="green", row=3, col=1)
         
-        # MACD chart
-        fig.add_trace(go.Scatter(x=df.index, y=df['MACD'],
-                               name='MACD',
-                               line=dict(color='blue')),
-                     row=4, col=1)
-        fig.add_trace(go.Scatter(x=df.index, y=df['Signal_Line'],
-                               name='Signal Line',
-                               line=dict(color='orange')),
-                     row=4, col=1)
-        
         # Update layout
         fig.update_layout(
             title=f'Technical Analysis for {symbol}',
@@ -125,46 +152,54 @@ class TechnicalAnalysisService:
     
     def get_technical_signals(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Generate technical analysis signals."""
+        # Accept raw price history as well as a frame that already has the indicators
+        if 'SMA_20' not in df.columns:
+            df = self.calculate_technical_indicators(df)
+        
+        # Every signal only looks at the latest row; extract it once
+        last = df.iloc[-1].to_dict()
         signals = {
-            'trend': self._analyze_trend(df),
-            'momentum': self._analyze_momentum(df),
-            'volatility': self._analyze_volatility(df),
-            'volume': self._analyze_volume(df)
+            'trend': self._analyze_trend(last),
+            'momentum': self._analyze_momentum(last),
+            'volatility': self._analyze_volatility(last),
+            'volume': self._analyze_volume(last)
         }
         return signals
     
-    def _analyze_trend(self, df: pd.DataFrame) -> str:
+    def _analyze_trend(self, last: Dict[str, float]) -> str:
         """Analyze price trend."""
-        if df['Close'].iloc[-1] > df['SMA_20'].iloc[-1] > df['SMA_50'].iloc[-1]:
+        close, sma_20, sma_50 = last['Close'], last['SMA_20'], last['SMA_50']
+        if close > sma_20 > sma_50:
             return "Strong Uptrend"
-        elif df['Close'].iloc[-1] > df['SMA_20'].iloc[-1]:
+        elif close > sma_20:
             return "Weak Uptrend"
-        elif df['Close'].iloc[-1] < df['SMA_20'].iloc[-1] < df['SMA_50'].iloc[-1]:
+        elif close < sma_20 < sma_50:
             return "Strong Downtrend"
-        elif df['Close'].iloc[-1] < df['SMA_20'].iloc[-1]:
+        elif close < sma_20:
             return "Weak Downtrend"
         return "Sideways"
     
-    def _analyze_momentum(self, df: pd.DataFrame) -> str:
+    def _analyze_momentum(self, last: Dict[str, float]) -> str:
         """Analyze momentum."""
-        if df['RSI'].iloc[-1] > 70:
+        rsi = last['RSI']
+        if rsi > 70:
             return "Overbought"
-        elif df['RSI'].iloc[-1] < 30:
+        elif rsi < 30:
             return "Oversold"
         return "Neutral"
     
-    def _analyze_volatility(self, df: pd.DataFrame) -> str:
+    def _analyze_volatility(self, last: Dict[str, float]) -> str:
         """Analyze volatility."""
-        if df['Close'].iloc[-1] > df['BB_Upper'].iloc[-1]:
+        if last['Close'] > last['BB_Upper']:
             return "High Volatility (Upper Band)"
-        elif df['Close'].iloc[-1] < df['BB_Lower'].iloc[-1]:
+        elif last['Close'] < last['BB_Lower']:
             return "High Volatility (Lower Band)"
         return "Normal Volatility"
     
-    def _analyze_volume(self, df: pd.DataFrame) -> str:
+    def _analyze_volume(self, last: Dict[str, float]) -> str:
         """Analyze volume."""
-        if df['Volume'].iloc[-1] > df['Volume_SMA'].iloc[-1] * 1.5:
+        if last['Volume'] > last['Volume_SMA'] * 1.5:
             return "High Volume"
-        elif df['Volume'].iloc[-1] < df['Volume_SMA'].iloc[-1] * 0.5:
+        elif last['Volume'] < last['Volume_SMA'] * 0.5:
             return "Low Volume"
-        return "Normal Volume" 
\ No newline at end of file
+        return "Normal Volume"
@@ -1,25 +1,34 @@
 import traceback
-from typing import TypeVar, Callable, Any, Optional
+from typing import TypeVar, Callable, Any, Optional, Dict
+from operator import attrgetter
+import threading
 import time
 import random
 from utils.debug_utils import DebugUtils
 from exceptions.stock_data_exceptions import RateLimitException, InvalidSymbolException, DataFetchException
 from config.settings import Settings
+from utils.rate_limiter import TokenBucket
 
 T = TypeVar('T')
 
+# One bucket for every Yahoo request in the process; Yahoo throttles per client, not per endpoint
+YAHOO_RATE_LIMITER = TokenBucket(Settings.API_RATE_LIMIT_PER_SECOND, Settings.API_RATE_LIMIT_BURST)
+
 class BaseFetcher:
     """Base class for fetching data with rate limiting and retry logic."""
     
+    _attr_getters: Dict[str, Callable[[Any], Any]] = {}
+    
     def __init__(self):
         """Initialize the base fetcher."""
         self.rate_limit_delay = Settings.API_RATE_LIMIT_DELAY
         self.max_retries = Settings.API_MAX_RETRIES
-        self.last_request_time = 0
         self.consecutive_failures = 0
         self.max_consecutive_failures = 3
         self.api_call_count = 0
         self._min_request_interval = 1.0
+        # The counters are shared by the threads fetching one symbol's statements
+        self._counter_lock = threading.Lock()
     
     def fetch_with_retry(self,symbol, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
         """
@@ -52,21 +61,19 @@ class BaseFetcher:
             try:
                 self._log_api_call(api_name, symbol)
                 self._wait_for_rate_limit()
-                
-                # Add jitter to avoid thundering herd
-                jitter: float = random.uniform(0, 1)
-                time.sleep(jitter)
                 result: T = func(*args, **kwargs)
-                self.consecutive_failures = 0  # Reset consecutive failures on success
+                with self._counter_lock:
+                    self.consecutive_failures = 0  # Reset consecutive failures on success
                 return result
                 
             except Exception as e:
                 last_error = e
                 error_msg: str = str(e)
-                print(traceback.format_exc())
+                DebugUtils.debug(traceback.format_exc())
 
                 if "Too Many Requests" in error_msg:
-                    self.consecutive_failures += 1
+                    with self._counter_lock:
+                        self.consecutive_failures += 1
                     if attempt < self.max_retries - 1:
                         wait_time: float = min(
                             self.rate_limit_delay * (2 ** attempt) + random.uniform(0, 1),
@@ -94,6 +101,23 @@ class BaseFetcher:
         if last_error:
             raise last_error
     
+    def fetch_attr_with_retry(self, symbol: str, stock: Any, attr: str) -> Any:
+        """
+        Read a lazily fetched Ticker attribute with retry logic.
+        
+        Args:
+            symbol: Stock symbol
+            stock: Yahoo Finance Ticker object
+            attr: Name of the attribute to read, e.g. "financials"
+            
+        Returns:
+            Value of the attribute
+        """
+        getter = BaseFetcher._attr_getters.get(attr)
+        if getter is None:
+            getter = BaseFetcher._attr_getters[attr] = attrgetter(attr)
+        return self.fetch_with_retry(symbol, getter, stock)
+    
     def _log_api_call(self, api_name: str, symbol: str) -> None:
         """
         Log API call details.
@@ -102,18 +126,15 @@ class BaseFetcher:
             api_name: Name of the API being called
             symbol: Stock symbol
         """
-        self.api_call_count += 1
-        DebugUtils.log_api_call(api_name, symbol, self.api_call_count, self.max_retries)
-        DebugUtils.debug(f"Consecutive Failures: {self.consecutive_failures}")
+        with self._counter_lock:
+            self.api_call_count += 1
+            call_count = self.api_call_count
+            consecutive_failures = self.consecutive_failures
+        DebugUtils.log_api_call(api_name, symbol, call_count, self.max_retries)
+        DebugUtils.debug(f"Consecutive Failures: {consecutive_failures}")
     
     def _wait_for_rate_limit(self) -> None:
         """Wait to respect rate limits."""
-        current_time: float = time.time()
-        time_since_last_request: float = current_time - self.last_request_time
-        
-        if time_since_last_request < self.rate_limit_delay:
-            sleep_time: float = self.rate_limit_delay - time_since_last_request
-            DebugUtils.debug(f"Rate limit: Waiting {sleep_time:.2f} seconds...")
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time() 
\ No newline at end of file
+        waited: float = YAHOO_RATE_LIMITER.acquire()
+        if waited > 0:
+            DebugUtils.debug(f"Rate limit: Waited {waited:.2f} seconds...") 
\ No newline at end of file
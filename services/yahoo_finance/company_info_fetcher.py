@@ -18,9 +18,7 @@ class CompanyInfoFetcher(BaseFetcher):
         """
         DebugUtils.info("\nFetching company info...")
         try:
-            lambda_info = lambda: stock.info
-            lambda_info.__name__="stock.info"
-            return self.fetch_with_retry(symbol, lambda_info)
+            return self.fetch_attr_with_retry(symbol, stock, 'info')
         except Exception as e:
             DebugUtils.error(f"Error fetching company info: {str(e)}")
             return {} 
\ No newline at end of file
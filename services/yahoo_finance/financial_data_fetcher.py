@@ -1,8 +1,10 @@
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 import yfinance as yf
 import pandas as pd
 from utils.debug_utils import DebugUtils
+from constants.Constants import TICKER_STATEMENT_ATTRIBUTES
 from .base_fetcher import BaseFetcher
 
 class FinancialDataFetcher(BaseFetcher):
@@ -31,37 +33,24 @@ class FinancialDataFetcher(BaseFetcher):
             }
         }
         
-        try:
-            # Fetch yearly financials
-            DebugUtils.info("\nFetching yearly financials...")
-            print("symbol ###### ",symbol)
-            lambda_stock_financials = lambda: stock.financials
-            lambda_stock_balancesheet = lambda: stock.balance_sheet
-            lambda_cashflow = lambda: stock.cashflow
-            lambda_quarterly_financials = lambda: stock.quarterly_financials
-            lambda_quarterly_balance_sheet = lambda: stock.quarterly_cashflow
-            lambda_quarterly_cashflow = lambda: stock.quarterly_cashflow
-
-            lambda_stock_financials.__name__= "stock.financials"
-            lambda_stock_balancesheet.__name__= "stock.balance_sheet"
-            lambda_cashflow.__name__= "stock.cashflow"
-            lambda_quarterly_financials.__name__= "stock.quarterly_financials"
-            lambda_quarterly_balance_sheet.__name__= "stock.quarterly_cashflow"
-            lambda_quarterly_cashflow.__name__= "stock.quarterly_cashflow"
-
-            financials['yearly']['income_statement'] = self.fetch_with_retry(symbol, lambda_stock_financials)
-            financials['yearly']['balance_sheet'] = self.fetch_with_retry(symbol, lambda_stock_balancesheet)
-            financials['yearly']['cashflow'] = self.fetch_with_retry(symbol, lambda_cashflow)
-            
-            # Fetch quarterly financials
-            DebugUtils.info("\nFetching quarterly financials...")
-
-            financials['quarterly']['income_statement'] = self.fetch_with_retry(symbol, lambda_quarterly_financials)
-            financials['quarterly']['balance_sheet'] = self.fetch_with_retry(symbol, lambda_quarterly_balance_sheet)
-            financials['quarterly']['cashflow'] = self.fetch_with_retry(symbol, lambda_quarterly_cashflow)
-            
-        except Exception as e:
-            print(traceback.format_exc())
-            DebugUtils.error(f"Error fetching financial data: {str(e)}")
+        DebugUtils.debug("Fetching financials for", symbol)
+        statements = [
+            (period, statement_type, attr)
+            for period, attrs in TICKER_STATEMENT_ATTRIBUTES.items()
+            for statement_type, attr in attrs.items()
+        ]
+        
+        # Each statement is a separate Yahoo request; issue them concurrently
+        with ThreadPoolExecutor(max_workers=len(statements)) as executor:
+            futures = [
+                (period, statement_type, executor.submit(self.fetch_attr_with_retry, symbol, stock, attr))
+                for period, statement_type, attr in statements
+            ]
+        
+        for period, statement_type, future in futures:
+            try:
+                financials[period][statement_type] = future.result()
+            except Exception as e:
+                DebugUtils.error(f"Error fetching {period} {statement_type}: {str(e)}\n{traceback.format_exc()}")
         
         return financials 
\ No newline at end of file
@@ -3,20 +3,23 @@ from typing import Dict, Any, List, Optional, Union, Callable, TypeVar, Tuple
 import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from models.stock_data import StockData, CompanyInfo, FinancialMetrics, TechnicalIndicators, TechnicalSignals, FinancialStatements, NewsItem
 from utils.debug_utils import DebugUtils
 from exceptions.stock_data_exceptions import RateLimitException, InvalidSymbolException, DataFetchException
 from services.analysis.financial_analysis import FinancialAnalyzer
 from services.analysis.technical_analysis import TechnicalAnalyzer
 from services.yahoo_finance.data_exporter import DataExporter
+from services.cache import FileCache, is_empty_result
 from config.settings import Settings
 from core.config import INCOME_STATEMENT_KEYS, BALANCE_SHEET_KEYS, CASHFLOW_KEYS
+from .base_fetcher import YAHOO_RATE_LIMITER
 from .historical_data_fetcher import HistoricalDataFetcher
 from .financial_data_fetcher import FinancialDataFetcher
 from .company_info_fetcher import CompanyInfoFetcher
 from .news_fetcher import NewsFetcher
-import random
 
 # Type aliases for commonly used types
 T = TypeVar('T')
@@ -25,6 +28,36 @@ FinancialData = Dict[str, Dict[str, pd.DataFrame]]
 StockDataDict = Dict[str, Any]
 NewsData = List[Dict[str, Any]]
 
+# Concurrent Yahoo requests per batch download; more than this mostly earns 429 Too Many Requests
+HISTORY_MAX_CONCURRENCY = 8
+
+
+class _LazyTicker:
+    """Creates a symbol's Ticker on first use and shares it, or its creation error, across threads."""
+    
+    def __init__(self, create: Callable[[], yf.Ticker]):
+        """Initialize the factory.
+        
+        Args:
+            create: Callable that creates and validates the Ticker
+        """
+        self._create = create
+        self._lock = threading.Lock()
+        self._ticker: Optional[yf.Ticker] = None
+        self.error: Optional[Exception] = None
+    
+    def __call__(self) -> yf.Ticker:
+        with self._lock:
+            if self._ticker is None and self.error is None:
+                try:
+                    self._ticker = self._create()
+                except Exception as e:
+                    self.error = e
+            if self.error is not None:
+                raise self.error
+            return self._ticker
+
+
 class YahooFinanceService:
     """Service for fetching stock data from Yahoo Finance."""
     
@@ -40,7 +73,7 @@ class YahooFinanceService:
         self._financial_fetcher = FinancialDataFetcher()
         self._company_info_fetcher = CompanyInfoFetcher()
         self._news_fetcher = NewsFetcher()
-        self._last_request_time = 0
+        self._cache = FileCache(Settings.CACHE_DIR)
         self._request_count = 0
         self._max_requests_per_minute = 30  # Yahoo Finance rate limit
         self.debug_mode = False
@@ -52,6 +85,8 @@ class YahooFinanceService:
         self.income_statement_keys = INCOME_STATEMENT_KEYS
         self.balance_sheet_keys = BALANCE_SHEET_KEYS
         self.cash_flow_keys = CASHFLOW_KEYS
+        # Default key filter for _filter_dict_by_keys, hashed once for O(1) lookups
+        self._statement_keys = frozenset(self.income_statement_keys + self.balance_sheet_keys + self.cash_flow_keys)
     def _debug_print(self, *args, **kwargs):
         """Print debug messages only if debug mode is enabled."""
         if self.debug_mode:
@@ -66,16 +101,9 @@ class YahooFinanceService:
 
     def _wait_for_rate_limit(self):
         """Wait to respect rate limits."""
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
-        
-        if time_since_last_request < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last_request
-            if self.debug_mode:
-                self._debug_print(f"Rate limit: Waiting {sleep_time:.2f} seconds...")
-            time.sleep(sleep_time)
-        
-        self._last_request_time = time.time()
+        waited = YAHOO_RATE_LIMITER.acquire()
+        if waited > 0 and self.debug_mode:
+            self._debug_print(f"Rate limit: Waited {waited:.2f} seconds...")
 
     def _fetch_with_retry(self,symbol,func: Callable, *args, max_retries: int = Settings.API_MAX_RETRIES, **kwargs) -> Any:
         """Execute a function with retry logic.
@@ -101,10 +129,6 @@ class YahooFinanceService:
                     self._log_api_call(func.__name__, args[0] if args else "Unknown")
                     self._wait_for_rate_limit()
 
-                    # Add jitter to avoid thundering herd
-                    jitter = random.uniform(0, 1)
-                    time.sleep(jitter)
-
                     # Validate symbol if present in args
                     if not symbol:
                         raise ValueError("Invalid symbol: Empty string")
@@ -155,6 +179,46 @@ class YahooFinanceService:
 
         raise DataFetchException(f"Failed after {max_retries} attempts: {str(last_error)}")
 
+    def fetch_historical_data_batch(self, symbols: List[str], period: str = "1y", interval: str = "1d") -> Dict[str, pd.DataFrame]:
+        """Fetch historical price data for many symbols with a single download.
+        
+        Args:
+            symbols: Stock symbols to fetch data for
+            period: Time period to fetch (default: "1y")
+            interval: Data interval (default: "1d")
+            
+        Returns:
+            Dictionary mapping each symbol to its historical price data;
+            symbols Yahoo Finance returned nothing for map to an empty DataFrame
+        """
+        self._log_api_call("download", ",".join(symbols))
+        # yf.download makes one request per ticker, so each one takes its own token
+        for _ in symbols:
+            self._wait_for_rate_limit()
+        # yf.download upper-cases tickers; split on that form, but key results by the caller's symbols
+        tickers = {symbol: symbol.strip().upper() for symbol in symbols}
+        # auto_adjust and actions match Ticker.history, so callers see the same columns either way
+        data = yf.download(
+            sorted(set(tickers.values())),
+            period=period,
+            interval=interval,
+            group_by="ticker",
+            auto_adjust=True,
+            actions=True,
+            threads=HISTORY_MAX_CONCURRENCY,
+            progress=False
+        )
+        
+        # Columns are (symbol, field); split them back into one frame per symbol
+        downloaded = set(data.columns.get_level_values(0)) if not data.empty else set()
+        history = {}
+        for symbol, ticker in tickers.items():
+            frame = data[ticker].dropna(how="all") if ticker in downloaded else pd.DataFrame()
+            if frame.empty:
+                self._debug.log_warning(f"No historical data returned for {symbol} (period={period}, interval={interval})")
+            history[symbol] = frame
+        return history
+    
     def get_provider_name(self) -> str:
         """Get the name of the data provider."""
         return "Yahoo Finance"
@@ -205,66 +269,43 @@ class YahooFinanceService:
                 'errors': []
             }
             
-            # Initialize ticker with retry
-            try:
-                ticker = self._fetch_with_retry(symbol,yf.Ticker,symbol)
-            except InvalidSymbolException as e:
-                data['errors'].append(str(e))
-                return data
-            except Exception as e:
-                self._debug.log_error(e, f"Error initializing ticker for {symbol}")
-                data['errors'].append(f"Error initializing ticker for {symbol}: {str(e)}")
-                return data
+            # Creating the ticker validates the symbol with a request of its own, so only
+            # do it once a section actually misses the cache
+            ticker = _LazyTicker(lambda: self._fetch_with_retry(symbol, yf.Ticker, symbol))
             
-            # Fetch data with retry logic
+            # Fetch data with retry logic; the requests are independent, so run them
+            # concurrently and wait for the slowest one rather than the sum of all four
+            fetches = []
             if not self._skip_history:
-                try:
-                    data['history'] = self._fetch_with_retry(
-                        symbol,
-                        self._historical_fetcher.fetch_historical_data,
-                        ticker,
-                        symbol
-                    )
-                except Exception as e:
-                    self._debug.log_error(e, f"Error fetching historical data for {symbol}")
-                    data['errors'].append(f"Error fetching historical data for {symbol}: {str(e)}")
+                fetches.append(('history', self._historical_fetcher.fetch_historical_data, "historical data", Settings.CACHE_TTL_HISTORY))
+            fetches.extend([
+                ('financials', self._financial_fetcher.fetch_financial_data, "financial data", Settings.CACHE_TTL_FINANCIALS),
+                ('info', self._company_info_fetcher.fetch_company_info, "company info", Settings.CACHE_TTL_COMPANY_INFO),
+                ('news', self._news_fetcher.fetch_news, "news", Settings.CACHE_TTL_NEWS),
+            ])
             
-            try:
-                data['financials'] = self._fetch_with_retry(
-                    symbol,
-                    self._financial_fetcher.fetch_financial_data,
-                    ticker,
-                    symbol
-                )
-            except Exception as e:
-                print(traceback.format_exc())
-
-                self._debug.log_error(e, f"Error fetching financial data for {symbol}")
-                data['errors'].append(f"Error fetching financial data for {symbol}: {str(e)}")
+            with ThreadPoolExecutor(max_workers=len(fetches)) as executor:
+                futures = [
+                    (key, description, executor.submit(self._fetch_cached, symbol, key, ttl, fetch, ticker))
+                    for key, fetch, description, ttl in fetches
+                ]
             
-            try:
-                data['info'] = self._fetch_with_retry(
-                    symbol,
-                    self._company_info_fetcher.fetch_company_info,
-                    ticker,
-                    symbol
-                )
-            except Exception as e:
-                self._debug.log_error(e, f"Error fetching company info for {symbol}")
-                data['errors'].append(f"Error fetching company info for {symbol}: {str(e)}")
+            for key, description, future in futures:
+                try:
+                    data[key] = future.result()
+                except Exception as e:
+                    if e is ticker.error:
+                        continue
+                    self._debug.log_error(e, f"Error fetching {description} for {symbol}")
+                    data['errors'].append(f"Error fetching {description} for {symbol}: {str(e)}")
             
-            try:
-                data['news'] = self._fetch_with_retry(
-                    symbol,
-                    self._news_fetcher.fetch_news,
-                    ticker,
-                    symbol
-                )
-            except Exception as e:
-                print(traceback.format_exc())
-
-                self._debug.log_error(e, f"Error fetching news for {symbol}")
-                data['errors'].append(f"Error fetching news for {symbol}: {str(e)}")
+            if isinstance(ticker.error, InvalidSymbolException):
+                data['errors'].append(str(ticker.error))
+                return data
+            if ticker.error is not None:
+                self._debug.log_error(ticker.error, f"Error initializing ticker for {symbol}")
+                data['errors'].append(f"Error initializing ticker for {symbol}: {str(ticker.error)}")
+                return data
             
             # Calculate metrics if we have historical data
             if not data['history'].empty:
@@ -295,6 +336,68 @@ class YahooFinanceService:
             self._debug.log_error(e, f"Error fetching data for {symbol}")
             raise DataFetchException(f"Failed to fetch data for {symbol}: {str(e)}")
     
+    def fetch_financials(self, symbol: str) -> FinancialData:
+        """Fetch the yearly and quarterly financial statements.
+        
+        Args:
+            symbol: Stock symbol to fetch data for
+            
+        Returns:
+            Dictionary mapping period to statement type to DataFrame
+        """
+        return self._fetch_section(symbol, 'financials', self._financial_fetcher.fetch_financial_data, Settings.CACHE_TTL_FINANCIALS)
+    
+    def fetch_company_info(self, symbol: str) -> Dict[str, Any]:
+        """Fetch company information.
+        
+        Args:
+            symbol: Stock symbol to fetch data for
+            
+        Returns:
+            Dictionary containing company information
+        """
+        return self._fetch_section(symbol, 'info', self._company_info_fetcher.fetch_company_info, Settings.CACHE_TTL_COMPANY_INFO)
+    
+    def fetch_news(self, symbol: str, limit: int = 5) -> NewsData:
+        """Fetch company news.
+        
+        Args:
+            symbol: Stock symbol to fetch data for
+            limit: Maximum number of news items to return (default: 5)
+            
+        Returns:
+            List of news items, newest first
+        """
+        return self._fetch_section(symbol, 'news', self._news_fetcher.fetch_news, Settings.CACHE_TTL_NEWS)[:limit]
+    
+    def _fetch_section(self, symbol: str, key: str, fetch: Callable, ttl: float) -> Any:
+        """Fetch a single section of stock data through the same cache as fetch_stock_data."""
+        symbol = symbol.strip().upper()
+        ticker = _LazyTicker(lambda: self._fetch_with_retry(symbol, yf.Ticker, symbol))
+        return self._fetch_cached(symbol, key, ttl, fetch, ticker)
+    
+    def _fetch_cached(self, symbol: str, key: str, ttl: float, fetch: Callable, ticker_factory: Callable[[], yf.Ticker]) -> Any:
+        """Fetch one section of stock data, reusing a fresh enough copy from the on-disk cache.
+        
+        Args:
+            symbol: Stock symbol
+            key: Section of the stock data, e.g. "financials"
+            ttl: Maximum age of a cached copy in seconds
+            fetch: Fetcher method to call on a cache miss
+            ticker_factory: Callable returning the Yahoo Finance Ticker, only called on a cache miss
+            
+        Returns:
+            The section's data
+        """
+        endpoint = f"stock_data_{key}"
+        data = self._cache.get(symbol, endpoint, (), ttl)
+        if data is None:
+            data = self._fetch_with_retry(symbol, fetch, ticker_factory(), symbol)
+            # Empty sections usually mean a failed fetch; don't pin them for a whole TTL
+            if not is_empty_result(data):
+                self._cache.set(symbol, endpoint, (), data)
+        return data
+    
     def _fetch_historical_data(self, ticker: yf.Ticker) -> Dict[str, Any]:
         """Fetch historical data for a ticker.
         
@@ -327,8 +430,8 @@ class YahooFinanceService:
     def filter_stock_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Filter and clean stock data."""
         filtered_data = {}
-        print("\n\n filter_stock_data ####### info \n ", data['info'])
-        print("\n\n filter_stock_data ####### financials \n ", data['financials'])
+        DebugUtils.debug("filter_stock_data info:", data['info'])
+        DebugUtils.debug("filter_stock_data financials:", data['financials'])
         # Filter info section
         if 'info' in data:
             filtered_data['info'] = self._filter_dict_by_keys(data['info'])
@@ -383,8 +486,7 @@ class YahooFinanceService:
 
     def _filter_dict_by_keys(self, data: Dict[str, Any], keys: List[str] = None) -> Dict[str, Any]:
         """Filter dictionary by specified keys."""
-        if keys is None:
-            keys = self.income_statement_keys + self.balance_sheet_keys + self.cash_flow_keys
+        keys = self._statement_keys if keys is None else frozenset(keys)
         return {k: v for k, v in data.items() if k in keys}
 
     def _filter_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -409,9 +511,8 @@ class YahooFinanceService:
         # Remove any columns with all NaN values
         df = df.dropna(axis=1, how='all')
 
-        # Format numbers to 2 decimal places
-        numeric_columns = df.select_dtypes(include=['float64', 'int64']).columns
-        df[numeric_columns] = df[numeric_columns].round(2)
+        # Format numbers to 2 decimal places; round() leaves non-numeric columns untouched
+        df = df.round(2)
 
         return df
 
@@ -421,8 +522,7 @@ class YahooFinanceService:
 
         # Get latest values from financial statements
         info = data.get("info", {})
-        print("\n\n _calculate_metrics #######  info \n ", info)
-        print("\n\n")
+        DebugUtils.debug("_calculate_metrics info:", info)
 
         # Income Statement Metrics
         metrics["Revenue"] = info.get("totalRevenue", 0)
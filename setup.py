@@ -18,12 +18,15 @@ setup(
     "google-api-python-client==2.120.0",
     "python-docx==1.1.0",
     "openpyxl==3.1.2",
+    "XlsxWriter==3.2.0",
     "ta==0.11.0",
     "pydrive2==1.21.3",
     "pydrive==1.3.1",
     "ollama==0.4.7",
     "markdown==3.7",
     "beautifulsoup4==4.12.2",
+    "lxml==5.3.0",
+    "orjson==3.10.15",
     "python-dateutil==2.8.2",
     "requests==2.32.3"
 ],
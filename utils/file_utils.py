@@ -1,9 +1,48 @@
 import os
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 import json
+import orjson
 from datetime import datetime, timedelta
 
+# orjson options for saved data: readable indentation, numpy scalars/arrays and non-string keys.
+# Datetimes go through `default` like they did with json.dump, keeping "YYYY-MM-DD HH:MM:SS" values
+JSON_DUMP_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+)
+
+
+def _stringify_keys(value: Any) -> Any:
+    """Recursively convert dict keys orjson rejects (e.g. pd.Timestamp) to strings."""
+    if isinstance(value, dict):
+        return {
+            key if key is None or isinstance(key, (str, int, float)) else str(key): _stringify_keys(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_stringify_keys(item) for item in value]
+    return value
+
+
+def _dump_json(data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize data with orjson; NaN and infinity are written as null."""
+    try:
+        return orjson.dumps(data, default=default, option=JSON_DUMP_OPTIONS)
+    except orjson.JSONEncodeError:
+        # OPT_NON_STR_KEYS only takes exact datetime/date keys, not subclasses such as pd.Timestamp
+        return orjson.dumps(_stringify_keys(data), default=default, option=JSON_DUMP_OPTIONS)
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse JSON written by either orjson or the json module, which may contain NaN/Infinity."""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
 class FileUtils:
     def __init__(self, input_dir: str, output_dir: str):
         self.input_dir = Path(input_dir)
@@ -37,8 +76,8 @@ class FileUtils:
     def save_json(self, data: dict, filename: str) -> None:
         """Save data as JSON file."""
         file_path = self.output_dir / filename
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=4)
+        with open(file_path, 'wb') as f:
+            f.write(_dump_json(data))
 
     def load_json(self, filename: str) -> Optional[dict]:
         """Load data from JSON file."""
@@ -46,8 +85,8 @@ class FileUtils:
         if not file_path.exists():
             return None
 
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            return _load_json(f.read())
 
     def get_report_filename(self, symbol: str, extension: str = ".docx") -> Path:
         """Generate a report filename for a stock symbol."""
@@ -69,8 +108,8 @@ class FileUtils:
     def save_filtered_data(self, symbol: str, data: Dict[str, Any], output_dir: Path) -> None:
         """Save filtered data to JSON file."""
         output_file = output_dir / f"{symbol}_filtered_data.json"
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=4, default=str)
+        with open(output_file, 'wb') as f:
+            f.write(_dump_json(data, default=str))
 
     def load_filtered_data(self, symbol: str, output_dir: Path) -> Dict[str, Any]:
         """Load filtered data from JSON file."""
@@ -78,8 +117,8 @@ class FileUtils:
         if not input_file.exists():
             return {}
         
-        with open(input_file, 'r') as f:
-            return json.load(f)
+        with open(input_file, 'rb') as f:
+            return _load_json(f.read())
 
     def cleanup_old_files(self, directory: Path, pattern: str, days: int) -> None:
         """Clean up files older than specified days."""
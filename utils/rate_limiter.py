@@ -0,0 +1,40 @@
+import threading
+import time
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Up to ``capacity`` requests may go out back to back; after that, callers are
+    paced at ``rate`` requests per second and only wait when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """Initialize the limiter with a full bucket.
+
+        Args:
+            rate: Sustained number of requests allowed per second
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it becomes available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative reserves a future token, so waiting callers are served in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait